@@ -0,0 +1,197 @@
+import sys
+from enum import Enum
+from datetime import datetime
+from dataclasses import dataclass
+from itertools import starmap
+
+
+# Enum class for defining different e-book genres
+class Genre(Enum):
+    FICTION = "Fiction"
+    NON_FICTION = "Non-Fiction"
+    SCIENCE = "Science"
+    HISTORY = "History"
+    TECHNOLOGY = "Technology"
+
+
+# Base class to represent an E-book in the catalog.
+# Frozen because e-books are shared between catalogs and carts; __slots__ is written out
+# (rather than slots=True) so this still runs on Python 3.9
+@dataclass(frozen=True)
+class EBook:
+    __slots__ = ('title', 'author', 'publication_date', 'genre', 'price')
+
+    title: str
+    author: str
+    publication_date: str
+    genre: Genre
+    price: float
+
+
+# Aggregation: EBookCatalog holds a collection of e-books,
+# but they exist independently of the catalog and could belong to multiple catalogs.
+class EBookCatalog:
+    __slots__ = ('ebooks',)
+
+    def __init__(self):
+        self.ebooks = []
+
+    def add_ebook(self, ebook):
+        self.ebooks.append(ebook)
+
+    def show_catalog(self):
+        print("Welcome to The Great E-Book Store!")
+        print("Available E-Books:")
+        for ebook in self.ebooks:
+            genre = ebook.genre.value if isinstance(ebook.genre, Genre) else ebook.genre
+            print(f"- {ebook.title} by {ebook.author} ({genre}): {ebook.price} AED")
+
+
+# Composition: Each Customer "owns" a Cart. If a Customer is removed, their Cart is also removed.
+class Customer:
+    __slots__ = ('name', 'contact_info', 'loyalty_member', 'cart')
+
+    def __init__(self, name, contact_info, loyalty_member=False):
+        self.name = name
+        self.contact_info = contact_info
+        self.loyalty_member = loyalty_member
+        self.cart = Cart(name)  # Cart is tightly linked to Customer
+
+    def is_loyalty_member(self):
+        return self.loyalty_member
+
+
+# Aggregation: Cart holds a list of e-book items but does not "own" them, allowing flexibility for each e-book to exist independently.
+class Cart:
+    __slots__ = ('_items', 'customer_name')
+
+    def __init__(self, customer_name):
+        # Keyed by the e-book itself (EBook is hashable by value): keeps insertion order like a list,
+        # but membership checks and removals don't have to scan the whole cart
+        self._items = {}
+        self.customer_name = customer_name
+
+    def add_item(self, ebook):
+        if ebook in self._items:
+            print(f"{ebook.title} is already in the cart.")
+            return
+        self._items[ebook] = ebook
+        print(f"{self.customer_name} added '{ebook.title}' to the cart.")
+
+    def remove_item(self, ebook):
+        if ebook in self._items:
+            del self._items[ebook]
+            print(f"{self.customer_name} removed '{ebook.title}' from the cart.")
+        else:
+            print(f"{ebook.title} is not in the cart.")
+
+    def get_items(self):
+        return list(self._items.values())
+
+    def total_price(self):
+        return sum(ebook.price for ebook in self._items)
+
+    # Kept so existing code reading cart.items still works; it returns a copy, so add/remove items through the cart
+    @property
+    def items(self):
+        return self.get_items()
+
+
+# Aggregation: DiscountCalculator takes a Customer and Cart to calculate discounts, but it does not own them.
+# Order uses _finalize instead; calculate_discount is kept as public API for working out a customer's discount directly.
+class DiscountCalculator:
+    LOYALTY_RATE = 0.10
+    BULK_RATE = 0.20
+    BULK_MIN_ITEMS = 5
+
+    @staticmethod
+    def calculate_discount(customer, base_total):
+        discount = 0
+        if customer.is_loyalty_member():
+            discount += base_total * DiscountCalculator.LOYALTY_RATE
+        if len(customer.cart.get_items()) >= DiscountCalculator.BULK_MIN_ITEMS:
+            discount += base_total * DiscountCalculator.BULK_RATE
+        return discount
+
+
+# Aggregation: VATCalculator calculates VAT for an order's subtotal but does not own the Order.
+# Like DiscountCalculator, it is kept as public API; _finalize applies VAT_RATE itself.
+class VATCalculator:
+    VAT_RATE = 0.08
+
+    @staticmethod
+    def calculate_vat(amount):
+        return amount * VATCalculator.VAT_RATE
+
+
+# Computes the loyalty and bulk discounts, total discount, subtotal, VAT and final total
+# for an order in one call, using the calculator rate constants but without any per-order
+# method calls or calculator objects.
+def _finalize(base_total, is_loyalty, cart_len):
+    loyalty_discount = base_total * DiscountCalculator.LOYALTY_RATE if is_loyalty else 0
+    bulk_discount = base_total * DiscountCalculator.BULK_RATE if cart_len >= DiscountCalculator.BULK_MIN_ITEMS else 0
+    discount = loyalty_discount + bulk_discount
+    subtotal = base_total - discount
+    vat = subtotal * VATCalculator.VAT_RATE
+    return loyalty_discount, bulk_discount, discount, subtotal, vat, round(subtotal + vat, 2)
+
+
+# Bulk version of _finalize for reports over many orders: takes parallel sequences of
+# base totals, loyalty flags and cart sizes and returns (discounts, subtotals, vats, final_totals).
+# It still calls _finalize once per row, so the only saving over building Orders is skipping Order.__init__.
+def batch_finalize(base_totals, loyalty_flags, cart_lens):
+    if not (len(base_totals) == len(loyalty_flags) == len(cart_lens)):
+        raise ValueError("base_totals, loyalty_flags and cart_lens must have the same length")
+    results = list(starmap(_finalize, zip(base_totals, loyalty_flags, cart_lens)))
+    if not results:
+        return (), (), (), ()
+    _, _, discounts, subtotals, vats, final_totals = zip(*results)
+    return discounts, subtotals, vats, final_totals
+
+
+# Composition: Each Order is associated with a Customer who places the order.
+class Order:
+    def __init__(self, customer, order_date=None):
+        self.__setattr__('customer', customer)
+        self.__setattr__('ebooks', customer.cart.get_items())
+        # When creating many orders at once, pass one shared timestamp instead of reading the clock per order
+        self.__setattr__('order_date', order_date if order_date is not None else datetime.now())
+
+        base_total = customer.cart.total_price()
+        self.__setattr__('base_total', base_total)
+
+        loyalty_discount, bulk_discount, discount, subtotal, vat, final_total = _finalize(
+            base_total, customer.loyalty_member, len(self.ebooks))
+        # The individual discounts are stored rounded so Invoice can print them directly
+        self.__setattr__('loyalty_discount', round(loyalty_discount, 2))
+        self.__setattr__('bulk_discount', round(bulk_discount, 2))
+        self.__setattr__('discount', discount)
+        self.__setattr__('subtotal', subtotal)
+        self.__setattr__('vat', vat)
+        self.__setattr__('final_total', final_total)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+
+# Composition: Each Invoice is generated for a specific Order.
+class Invoice:
+    def generate(self, order):
+        # Collect the whole invoice first and write it out once instead of one print() per line
+        parts = [
+            f"Invoice for {order.customer.name}",
+            f"Order Date: {order.order_date}\n",
+            "The Great E-Book Shopping Cart:",
+        ]
+        parts.extend(f"- {ebook.title} by {ebook.author}: {ebook.price} AED" for ebook in order.ebooks)
+        parts.append("\nOrder Confirmation:")
+        parts.append(f"Base Total: {order.base_total} AED")
+        if order.loyalty_discount:
+            parts.append(f"Loyalty Discount (10%): -{order.loyalty_discount} AED")
+        if order.bulk_discount:
+            parts.append(f"Bulk Discount (20%): -{order.bulk_discount} AED")
+        parts.append(f"Total Discount: -{round(order.discount, 2)} AED")
+        parts.append(f"Subtotal after Discounts: {round(order.subtotal, 2)} AED")
+        parts.append(f"VAT (8%): +{round(order.vat, 2)} AED")
+        parts.append(f"Final Total: {order.final_total} AED\n")
+        sys.stdout.write("\n".join(parts) + "\n")
@@ -0,0 +1,71 @@
+from program_fund import Genre, EBook, EBookCatalog, Customer, Order, Invoice, batch_finalize
+
+# Sample Test Cases
+
+# Create an e-book catalog and add some e-books
+catalog = EBookCatalog()
+ebook1 = EBook("Python Programming", "Afshan Parkar", "2020", Genre.TECHNOLOGY, 50)
+ebook2 = EBook("Cat In The Hat", "Dr. Seuss", "1957", Genre.FICTION, 30)
+ebook3 = EBook("The Great Roman Empire", "John Smith", "2007", Genre.HISTORY, 75)
+ebook4 = EBook("Pride and Prejudice", "Jane Austen", "1813", Genre.NON_FICTION, 40)
+ebook5 = EBook("Cosmos", "Carl Sagan", "1980", Genre.SCIENCE, 60)
+
+catalog.add_ebook(ebook1)
+catalog.add_ebook(ebook2)
+catalog.add_ebook(ebook3)
+catalog.add_ebook(ebook4)
+catalog.add_ebook(ebook5)
+
+# Display the shop catalog
+catalog.show_catalog()
+
+# Test Case 1: Customer1 - Ayesha (Loyalty member with a bulk order)
+customer1 = Customer("Customer1: Ayesha", "ayesha1212@mail.com", loyalty_member=True)
+customer1.cart.add_item(ebook1)
+customer1.cart.add_item(ebook2)
+customer1.cart.add_item(ebook3)
+customer1.cart.add_item(ebook4)
+customer1.cart.add_item(ebook5)
+customer1.cart.remove_item(ebook3)
+order1 = Order(customer1)
+invoice1 = Invoice()
+invoice1.generate(order1)
+
+# Test Case 2: Customer2 - Mohammed (Non-loyalty member with a bulk order)
+customer2 = Customer("Customer2: Mohammed", "Mohammed123@mail.com", loyalty_member=False)
+customer2.cart.add_item(ebook1)
+customer2.cart.add_item(ebook2)
+customer2.cart.add_item(ebook3)
+customer2.cart.add_item(ebook4)
+customer2.cart.add_item(ebook5)
+order2 = Order(customer2)
+invoice2 = Invoice()
+invoice2.generate(order2)
+
+# Test Case 3: Customer3 - Afra (Loyalty member with a smaller order)
+customer3 = Customer("Customer3: Afra", "Afra345@mail.com", loyalty_member=True)
+customer3.cart.add_item(ebook1)
+customer3.cart.add_item(ebook2)
+customer3.cart.add_item(ebook3)
+order3 = Order(customer3)
+invoice3 = Invoice()
+invoice3.generate(order3)
+
+# Test Case 4: Customer4 - Amna (Non-loyalty member with a single book)
+customer4 = Customer("Customer4: Amna", "amna78@mail.com", loyalty_member=False)
+customer4.cart.add_item(ebook1)
+order4 = Order(customer4)
+invoice4 = Invoice()
+invoice4.generate(order4)
+
+# Test Case 5: Bulk totals for the four orders above, computed with batch_finalize instead of building Orders
+orders = [order1, order2, order3, order4]
+discounts, subtotals, vats, final_totals = batch_finalize(
+    [order.base_total for order in orders],
+    [order.customer.is_loyalty_member() for order in orders],
+    [len(order.ebooks) for order in orders])
+print(f"Bulk Discounts: {[round(discount, 2) for discount in discounts]}")
+print(f"Bulk Subtotals: {[round(subtotal, 2) for subtotal in subtotals]}")
+print(f"Bulk VAT: {[round(vat, 2) for vat in vats]}")
+print(f"Bulk Final Totals: {list(final_totals)}")
+print(f"Bulk totals match per-order totals: {list(final_totals) == [order.final_total for order in orders]}")